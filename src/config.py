@@ -1,11 +1,17 @@
 from pydantic_settings import BaseSettings
 
+DEFAULT_FAST_PATH_THRESHOLD = 0.97
+DEFAULT_FAST_PATH_MARGIN = 0.03
+
 class Settings(BaseSettings):
     groq_api_key: str
     groq_api_url: str
     mistral_api_key: str
     qdrant_url: str
     postgres_url: str
+    fast_path_enabled: bool = False
+    fast_path_threshold: float = DEFAULT_FAST_PATH_THRESHOLD
+    fast_path_margin: float = DEFAULT_FAST_PATH_MARGIN
 
     class Config:
         env_file = ".env"
@@ -1,4 +1,4 @@
-from src.agent import get_response
+from src.router import route_response, router_stats
 from src.eval import evaluate_response
 from src.tools import REGISTERED_TOOLS
 from pydantic import BaseModel
@@ -24,12 +24,13 @@ class ChatResponse(BaseModel):
     response: str | None = None
     chunks: list | None = None
     sql: list | None = None
+    route: str | None = None
     error: str | None = None  
 
 @app.post("/chat", response_model=ChatResponse)
 def chat_endpoint(req: ChatRequest):
     try:
-        response = get_response(
+        response = route_response(
             query=req.query,
             chat_history=req.chat_history,
             tools=REGISTERED_TOOLS,
@@ -40,6 +41,7 @@ def chat_endpoint(req: ChatRequest):
             response=response.get("response"),
             chunks=response.get("chunks"),
             sql=response.get("sql"),
+            route=response.get("route"),
         )
 
     except Exception as e:
@@ -63,6 +65,10 @@ async def eval_endpoint(req: ChatResponse):
         print("Error in /eval:", traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/router/stats")
+def router_stats_endpoint():
+    return router_stats.snapshot()
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,177 @@
+import re
+import threading
+import traceback
+from typing import Any, Dict, List, Optional, Set
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.agent import get_response, DEFAULT_HISTORY_MAX
+from src.config import settings
+from src.prompt import fast_path_prompt
+from src.utils import get_llm, get_vanna
+
+DEFAULT_RESULT_MAX_ROWS = 50
+
+# Words that flip the meaning of an otherwise near-identical question
+CONTRAST_TERMS = {
+    "highest", "lowest", "most", "least", "top", "bottom", "max", "min",
+    "maximum", "minimum", "largest", "smallest", "biggest", "higher", "lower",
+    "more", "less", "increase", "decrease", "best", "worst",
+    "hourly", "daily", "weekly", "monthly", "quarterly", "yearly", "annual",
+    "hour", "day", "week", "month", "quarter", "year", "years",
+    "legitimate", "fraud", "fraudulent", "not", "without", "excluding",
+    "male", "female", "men", "women", "average", "median", "sum",
+    "one", "two", "three", "four", "five", "six", "ten", "twelve",
+}
+
+
+class RouterStats:
+    """
+    Thread-safe counters of how much traffic each route handled.
+
+    Counters are per process and reset on restart.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.fast_path = 0
+        self.agent = 0
+        self.fast_path_errors = 0
+
+    def record(self, route: str):
+        with self._lock:
+            if route == "fast_path":
+                self.fast_path += 1
+            elif route == "fast_path_error":
+                self.fast_path_errors += 1
+            else:
+                self.agent += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.fast_path + self.agent
+            return {
+                "total": total,
+                "fast_path": self.fast_path,
+                "agent": self.agent,
+                "fast_path_errors": self.fast_path_errors,
+                "fast_path_share": self.fast_path / total if total else 0.0,
+            }
+
+
+router_stats = RouterStats()
+
+
+def _tokens(text: str) -> Set[str]:
+    return set(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def _normalize(text: str) -> str:
+    return " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def has_conflicting_terms(query: str, question: str) -> bool:
+    """
+    True if the two texts differ in a word that changes what the SQL must do
+    (e.g. highest vs lowest, daily vs weekly) or in any number (2020 vs 2023).
+    """
+    differing = _tokens(query) ^ _tokens(question)
+    return any(t in CONTRAST_TERMS or t.isdigit() for t in differing)
+
+
+def match_known_question(
+        query: str,
+        *,
+        threshold: float,
+        margin: float,
+    ) -> Optional[Dict[str, Any]]:
+    """
+    Return the trained question/SQL pair matching `query`, or None.
+
+    A repeat of a trained question (ignoring case and punctuation) always
+    matches. Otherwise the best match needs a similarity of at least
+    `threshold`, must beat the runner-up by `margin`, and must not differ
+    from the query in a contrast term such as lowest/highest.
+    """
+    matches = get_vanna().match_question_sql(query, k=2)
+    if not matches:
+        return None
+
+    best = matches[0]
+    if _normalize(query) == _normalize(best["question"]):
+        return best
+    if best["score"] < threshold:
+        return None
+    if len(matches) > 1 and best["score"] - matches[1]["score"] < margin:
+        return None
+    if has_conflicting_terms(query, best["question"]):
+        return None
+
+    return best
+
+
+def summarize_sql_result(query: str, sql: str, result) -> str:
+    """
+    Write the answer from a SQL result with a single LLM call, falling back
+    to the raw result table if the call fails.
+    """
+    table = result.head(DEFAULT_RESULT_MAX_ROWS).to_markdown(index=False)
+    if len(result) > DEFAULT_RESULT_MAX_ROWS:
+        table += f"\n\n(showing first {DEFAULT_RESULT_MAX_ROWS} of {len(result)} rows)"
+
+    messages = [
+        SystemMessage(content=fast_path_prompt),
+        HumanMessage(content=f"Question: {query}\n\nSQL:\n{sql}\n\nResult:\n{table}"),
+    ]
+    try:
+        return get_llm().invoke(messages).content
+    except Exception:
+        print("Fast path summarization failed:", traceback.format_exc())
+        return f"Result of the query for \"{query}\":\n\n{table}"
+
+
+def route_response(
+        query: str,
+        chat_history: List[Dict[str, Any]],
+        tools: List[Any], *,
+        history_max: int = DEFAULT_HISTORY_MAX,
+        threshold: Optional[float] = None,
+        margin: Optional[float] = None,
+    ) -> dict[str, Any]:
+    """
+    Answer known questions by running their stored SQL directly and
+    summarizing the result; fall back to the agent loop otherwise.
+
+    The fast path answers from the query alone and ignores `chat_history`.
+    Follow-ups that only make sense with earlier turns ("what about last
+    month?") are not near-duplicates of a trained question and normally go
+    to the agent, which does see the history.
+    `threshold` and `margin` default to the `fast_path_*` settings.
+    """
+    match = None
+    if query.strip() and settings.fast_path_enabled:
+        try:
+            match = match_known_question(
+                query,
+                threshold=settings.fast_path_threshold if threshold is None else threshold,
+                margin=settings.fast_path_margin if margin is None else margin,
+            )
+            if match:
+                result = get_vanna().run_sql(match["sql"])
+        except Exception:
+            match = None
+            router_stats.record("fast_path_error")
+            print("Fast path failed, falling back to agent:", traceback.format_exc())
+
+    if match:
+        router_stats.record("fast_path")
+        return {
+            "response": summarize_sql_result(query, match["sql"], result),
+            "chunks": [],
+            "sql": [match["sql"]],
+            "route": "fast_path",
+        }
+
+    router_stats.record("agent")
+    response = get_response(query, chat_history, tools, history_max=history_max)
+    return {**response, "route": "agent"}
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import threading
 from functools import lru_cache
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, List
 from urllib.parse import urlparse
 
+import numpy as np
+
 from langchain.chat_models import init_chat_model
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_qdrant import QdrantVectorStore
@@ -83,6 +86,55 @@ class MyVanna(PatchVannaBase, VannaQdrant_VectorStore, VannaMistral):
                 **({} if config is None else config),
             },
         )
+        self._question_index = None
+        self._question_index_lock = threading.Lock()
+
+    def _count_question_sql(self) -> int:
+        return self._client.count(self.sql_collection_name, exact=True).count
+
+    def _get_question_index(self):
+        """
+        Return (pairs, embeddings) for trained question/SQL pairs.
+
+        Rebuilt when the SQL collection's point count changes, so pairs trained
+        after startup are picked up. An empty index is never cached.
+        """
+        count = self._count_question_sql()
+        with self._question_index_lock:
+            if self._question_index is not None and self._question_index[0] == count:
+                return self._question_index[1:]
+
+            df = self.get_training_data()
+            if df.empty:
+                return [], None
+            pairs = df[df["training_data_type"] == "sql"][["question", "content"]].values.tolist()
+            if not pairs:
+                return [], None
+
+            embeddings = np.array([self.generate_embedding(q) for q, _ in pairs], dtype=float)
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+            self._question_index = (count, pairs, embeddings)
+            return pairs, embeddings
+
+    def match_question_sql(self, question: str, k: int = 2) -> List[Dict[str, Any]]:
+        """
+        Return the `k` trained question/SQL pairs closest to `question`, best first.
+
+        Vanna embeds "Question: ...\n\nSQL: ..." for each pair, so scores from
+        `get_similar_question_sql` depend on SQL length. Here the score is the
+        cosine similarity against the trained question text only.
+        """
+        pairs, embeddings = self._get_question_index()
+        if not pairs:
+            return []
+
+        query = np.array(self.generate_embedding(question))
+        scores = embeddings @ (query / np.linalg.norm(query))
+        top = np.argsort(-scores)[:k]
+        return [
+            {"question": pairs[i][0], "sql": pairs[i][1], "score": float(scores[i])}
+            for i in top
+        ]
 
 
 def _pg_conn_kwargs_from_url(pg_url: str) -> Dict[str, Optional[str]]: